@@ -0,0 +1,59 @@
+"""
+Glyph blit for the Dotti framebuffer, with optional Numba acceleration.
+
+``blit_glyph`` composes one packed uint64 glyph mask into a flat
+192-byte RGB framebuffer (background fill plus foreground stamp). When
+Numba and NumPy are installed the inner loop runs as a compiled kernel;
+otherwise a pure-Python implementation with the same signature is used,
+so callers never need to care which one they got.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+
+    HAVE_NUMBA = True
+
+    @njit(cache=True)
+    def _blit_glyph_kernel(dst, mask, fg_r, fg_g, fg_b, bg_r, bg_g, bg_b):
+        for i in range(64):
+            j = i * 3
+            if (mask >> i) & 1:
+                dst[j] = fg_r
+                dst[j + 1] = fg_g
+                dst[j + 2] = fg_b
+            else:
+                dst[j] = bg_r
+                dst[j + 1] = bg_g
+                dst[j + 2] = bg_b
+
+    def blit_glyph(dst: bytearray, mask: int, fg: bytes, bg: bytes) -> None:
+        """
+        Render a glyph mask into ``dst`` (192 bytes, RGB per pixel).
+
+        Bit (y*8 + x) of ``mask`` selects foreground; everything else is
+        filled with the background color. The numpy view aliases the
+        bytearray, so the kernel writes into the caller's buffer in place.
+        """
+        view = np.frombuffer(dst, dtype=np.uint8)
+        _blit_glyph_kernel(view, np.uint64(mask),
+                           fg[0], fg[1], fg[2], bg[0], bg[1], bg[2])
+
+except ImportError:
+    HAVE_NUMBA = False
+
+    def blit_glyph(dst: bytearray, mask: int, fg: bytes, bg: bytes) -> None:
+        """
+        Render a glyph mask into ``dst`` (192 bytes, RGB per pixel).
+
+        Pure-Python fallback: C-level background fill, then a bit walk
+        over the mask that only touches lit pixels.
+        """
+        dst[:] = bg * 64
+        i = 0
+        while mask:
+            if mask & 1:
+                j = i * 3
+                dst[j:j + 3] = fg
+            mask >>= 1
+            i += 1
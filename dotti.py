@@ -28,10 +28,14 @@ License: MIT
 """
 
 import asyncio
-from typing import Optional, Tuple, List
+import logging
+import struct
+from typing import Iterable, Optional, Tuple, List
 from bleak import BleakClient, BleakScanner
 from bleak.backends.device import BLEDevice
 
+from _blit import blit_glyph
+
 
 # Dotti BLE UUIDs (from reverse engineering)
 DOTTI_SERVICE_UUID = "0000fff0-0000-1000-8000-00805f9b34fb"
@@ -40,6 +44,28 @@ DOTTI_WRITE_CHAR_UUID = "0000fff3-0000-1000-8000-00805f9b34fb"
 # Dotti device name prefix
 DOTTI_DEVICE_NAME = "Dotti"
 
+logger = logging.getLogger(__name__)
+
+# Pre-bound C-level packers for the fixed-size command frames; skips the
+# list construction that bytes([...]) pays on every command
+_PACK_SET_PIXEL = struct.Struct("6B").pack
+_PACK_SET_ALL = struct.Struct("5B").pack
+_PACK_SLOT = struct.Struct("3B").pack
+
+
+def _clamp_rgb(r: int, g: int, b: int) -> Tuple[int, int, int]:
+    """
+    Clamp RGB components to 0-255.
+
+    OR-ing the three values folds all bounds checks into one comparison,
+    so in-range input (the normal case) costs a single branch instead of
+    six max/min calls.
+    """
+    m = r | g | b
+    if 0 <= m < 256:
+        return r, g, b
+    return (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
+
 
 class DottiColor:
     """Predefined colors for convenience."""
@@ -75,25 +101,73 @@ class Dotti:
     
     GRID_SIZE = 8
     TOTAL_PIXELS = 64
-    
-    def __init__(self, address: Optional[str] = None):
+
+    # Cached command payloads: animations hammer set_all_pixels with the
+    # same handful of DottiColor constants, and brightness has only 101
+    # possible payloads, so build each frame exactly once
+    _ALL_PIXEL_CACHE: dict = {}
+    _BRIGHTNESS_CMDS = [bytes((0x06, 0x02, i)) for i in range(101)]
+
+    # Precomputed buffer geometry: a row is one contiguous 24-byte slice
+    # (single memcpy to update); a column is 8 fixed byte offsets
+    _ROW_SLICES = [slice(r * 24, (r + 1) * 24) for r in range(8)]
+    _COL_INDICES = [[(y * 8 + c) * 3 for y in range(8)] for c in range(8)]
+
+    def __init__(self, address: Optional[str] = None, debug: bool = False,
+                 keepalive: bool = False, coalesce: bool = False):
         """
         Initialize the Dotti controller.
-        
+
         Args:
             address: Optional MAC/UUID address of the Dotti device.
                     If not provided, will scan for nearby devices.
+            debug: If True, log the device's full service/characteristic
+                    tree after connecting.
+            keepalive: If True, send a cheap no-op command every couple of
+                    seconds while connected. Keeps the link in its fast
+                    state and avoids the 10-15 s reconnect cost some
+                    platforms incur once a connection goes idle.
+            coalesce: If True, ``set_pixel`` only updates the local buffer
+                    and returns immediately; a background task flushes the
+                    buffer as one bulk frame at ~60 Hz. Rapid per-pixel
+                    updates then collapse into a single GATT write per
+                    flush interval instead of one write each.
         """
         self.address = address
+        self._debug = debug
+        self._keepalive = keepalive
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._coalesce = coalesce
+        self._coalesce_task: Optional[asyncio.Task] = None
+        self._dirty = False
+        self._last_brightness = 100
         self.client: Optional[BleakClient] = None
         self.device: Optional[BLEDevice] = None
         self._connected = False
-        
-        # Internal pixel buffer (8x8 RGB)
-        self._pixel_buffer: List[List[Tuple[int, int, int]]] = [
-            [(0, 0, 0) for _ in range(self.GRID_SIZE)]
-            for _ in range(self.GRID_SIZE)
-        ]
+
+        # Negotiated ATT MTU; refreshed on connect. 23 is the BLE default
+        # (20 usable payload bytes) and the conservative fallback
+        self._mtu = 23
+
+        # One outstanding GATT write at a time; with response=True the
+        # stack already waits for the ACK, so no extra pacing is needed
+        self._write_sem = asyncio.Semaphore(1)
+
+        # When False, all writes go out without response so multiple
+        # frames can pipeline into one connection interval - useful for
+        # lossy animations, where a dropped frame is invisible
+        self.reliable_writes: bool = True
+        
+        # Internal pixel buffer: flat contiguous RGB bytes, one triple per
+        # pixel, indexed as (y*8 + x)*3. A single bytearray instead of
+        # nested lists of tuples: O(1) byte stores, ~10x less memory, and
+        # it can be framed for the wire without a serialization pass.
+        self._pixel_buffer = bytearray(self.TOTAL_PIXELS * 3)
+
+        # Preallocated bulk-frame packet: 0x07 0x01 header + 64 RGB triples
+        self._frame_buf = bytearray(2 + self.TOTAL_PIXELS * 3)
+        self._frame_buf[0] = 0x07
+        self._frame_buf[1] = 0x01
     
     @staticmethod
     async def scan(timeout: float = 10.0) -> List[BLEDevice]:
@@ -106,17 +180,24 @@ class Dotti:
         Returns:
             List of discovered Dotti devices.
         """
-        print(f"Scanning for Dotti devices ({timeout}s)...")
-        devices = await BleakScanner.discover(timeout=timeout)
-        
+        logger.info("Scanning for Dotti devices (%ss)...", timeout)
+        # Filter by service UUID in the OS scanner (SetDiscoveryFilter on
+        # BlueZ, scanForPeripherals(withServices:) on CoreBluetooth), so
+        # unrelated advertisements never cross into Python at all
+        devices = await BleakScanner.discover(
+            timeout=timeout, service_uuids=[DOTTI_SERVICE_UUID]
+        )
+
         dotti_devices = []
         for device in devices:
+            # Name check kept as a fallback filter: some firmware omits the
+            # service UUID from the connectable advertisement
             if device.name and DOTTI_DEVICE_NAME in device.name:
                 dotti_devices.append(device)
-                print(f"  Found: {device.name} [{device.address}]")
+                logger.info("Found: %s [%s]", device.name, device.address)
         
         if not dotti_devices:
-            print("  No Dotti devices found.")
+            logger.info("No Dotti devices found.")
         
         return dotti_devices
     
@@ -134,70 +215,190 @@ class Dotti:
             True if connection successful, False otherwise.
         """
         if self._connected:
-            print("Already connected.")
+            logger.debug("Already connected.")
             return True
         
         # If no address provided, scan for devices
         if not self.address:
             devices = await self.scan(timeout)
             if not devices:
-                print("No Dotti device found to connect to.")
+                logger.warning("No Dotti device found to connect to.")
                 return False
             self.device = devices[0]
             self.address = self.device.address
-            print(f"Selected: {self.device.name} [{self.address}]")
+            logger.info("Selected: %s [%s]", self.device.name, self.address)
         
         try:
-            print(f"Connecting to {self.address}...")
+            logger.info("Connecting to %s...", self.address)
             self.client = BleakClient(self.address)
             await self.client.connect(timeout=timeout)
             self._connected = True
-            print("Connected successfully!")
+            logger.info("Connected successfully!")
             
-            # Discover services (for debugging)
-            services = self.client.services
-            for service in services:
-                print(f"  Service: {service.uuid}")
-                for char in service.characteristics:
-                    print(f"    Characteristic: {char.uuid} - Properties: {char.properties}")
+            # Service enumeration is useful when reverse-engineering but
+            # walks every characteristic over DBus/XPC; keep it off the
+            # connect critical path unless debugging was requested
+            if self._debug:
+                for service in self.client.services:
+                    logger.debug("  Service: %s", service.uuid)
+                    for char in service.characteristics:
+                        logger.debug("    Characteristic: %s - Properties: %s",
+                                     char.uuid, char.properties)
             
+            # Ask for a short connection interval; per-write latency is
+            # dominated by the interval the OS negotiated for us
+            await self._request_fast_connection()
+
+            # Bleak backends exchange the MTU during connect; record the
+            # result so bulk frames can be sized to fit whole packets
+            try:
+                self._mtu = self.client.mtu_size
+            except Exception:
+                self._mtu = 23
+            logger.debug("Negotiated ATT MTU: %d", self._mtu)
+
+            if self._keepalive:
+                self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+            if self._coalesce:
+                self._coalesce_task = asyncio.create_task(self._coalesce_loop())
+
             return True
-            
+
         except Exception as e:
-            print(f"Connection failed: {e}")
+            logger.warning("Connection failed: %s", e)
             self._connected = False
             return False
+
+    async def _request_fast_connection(self):
+        """
+        Best-effort request for a short BLE connection interval.
+
+        The default interval negotiated by the OS is typically 50-100 ms
+        and is the single largest latency knob for GATT writes; 7.5-15 ms
+        (units of 1.25 ms below) cuts per-write latency 5-10x. Only some
+        backends expose this, so unsupported platforms fall back silently
+        to the negotiated default.
+        """
+        backend = getattr(self.client, "_backend", None)
+        if backend is None:
+            return
+        try:
+            update = getattr(backend, "update_connection_parameters", None)
+            if update is not None:
+                await update(min_interval=6, max_interval=12, latency=0, timeout=400)
+        except Exception:
+            # Unsupported backend/platform - keep the default interval
+            pass
     
     async def disconnect(self):
         """Disconnect from the Dotti device."""
+        for task in (self._keepalive_task, self._coalesce_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._keepalive_task = None
+        self._coalesce_task = None
+
         if self.client and self._connected:
             await self.client.disconnect()
             self._connected = False
-            print("Disconnected.")
-    
+            logger.info("Disconnected.")
+
+    async def __aenter__(self) -> "Dotti":
+        """Support ``async with Dotti() as dotti:`` usage."""
+        connected = await self.connect()
+        if not connected:
+            raise RuntimeError("Could not connect to Dotti device.")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+
+    async def _keepalive_loop(self, interval: float = 2.0):
+        """
+        Re-send the current brightness periodically as a no-op.
+
+        The command has no visual effect but keeps the GATT queue warm so
+        the link stays in its low-latency state between bursts of writes.
+        """
+        try:
+            while self.is_connected:
+                await asyncio.sleep(interval)
+                await self._write(
+                    self._BRIGHTNESS_CMDS[self._last_brightness],
+                    reliable=False,
+                )
+        except (asyncio.CancelledError, RuntimeError):
+            pass
+
+    async def _coalesce_loop(self, interval: float = 1 / 60):
+        """
+        Drain buffered pixel updates once per flush interval.
+
+        All set_pixel calls that landed since the last flush go out as one
+        bulk frame; idle intervals cost nothing but the sleep wakeup.
+        """
+        try:
+            while self.is_connected:
+                await asyncio.sleep(interval)
+                if self._dirty:
+                    self._dirty = False
+                    await self._flush_buffer()
+        except (asyncio.CancelledError, RuntimeError):
+            pass
+
     @property
     def is_connected(self) -> bool:
         """Check if currently connected."""
         return self._connected and self.client is not None and self.client.is_connected
     
-    async def _write(self, data: bytes):
+    async def _write(self, data: bytes, reliable: bool = True):
         """
         Write raw data to the Dotti.
-        
+
         Args:
             data: Bytes to write to the device.
+            reliable: If True (and ``reliable_writes`` is on), use a GATT
+                write-with-response, which waits for the device ACK.
+                Write-without-response pipelines several packets per
+                connection interval but gives no delivery guarantee.
         """
         if not self.is_connected:
             raise RuntimeError("Not connected to Dotti device.")
-        
-        await self.client.write_gatt_char(
-            DOTTI_WRITE_CHAR_UUID,
-            data,
-            response=True
-        )
-        # Small delay to prevent overwhelming the device
-        await asyncio.sleep(0.01)
+
+        async with self._write_sem:
+            await self.client.write_gatt_char(
+                DOTTI_WRITE_CHAR_UUID,
+                data,
+                response=reliable and self.reliable_writes
+            )
     
+    async def _flush_buffer(self):
+        """
+        Send the entire pixel buffer to the device as one bulk frame.
+
+        Packs all 64 pixels into the preallocated frame packet and issues
+        a single GATT write instead of 64 per-pixel round-trips. When the
+        negotiated MTU is too small for the whole frame, it is split into
+        MTU-sized fragments (ATT payload is MTU minus the 3-byte header),
+        which is still far cheaper than per-pixel commands.
+        """
+        self._frame_buf[2:] = self._pixel_buffer
+        frame = bytes(self._frame_buf)
+
+        payload = self._mtu - 3
+        if len(frame) <= payload:
+            await self._write(frame)
+            return
+
+        view = memoryview(frame)
+        for offset in range(0, len(frame), payload):
+            await self._write(view[offset:offset + payload])
+
     async def set_pixel(self, x: int, y: int, r: int, g: int, b: int):
         """
         Set a single pixel color.
@@ -211,21 +412,45 @@ class Dotti:
         """
         if not (0 <= x < self.GRID_SIZE and 0 <= y < self.GRID_SIZE):
             raise ValueError(f"Coordinates must be 0-7, got x={x}, y={y}")
-        
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        
+
+        r, g, b = _clamp_rgb(r, g, b)
+
+        # Update internal buffer
+        i = (y * self.GRID_SIZE + x) * 3
+        self._pixel_buffer[i] = r
+        self._pixel_buffer[i + 1] = g
+        self._pixel_buffer[i + 2] = b
+
+        # In coalescing mode the background flusher picks the change up on
+        # its next tick; bursts of set_pixel calls merge into one frame
+        if self._coalesce:
+            self._dirty = True
+            return
+
         # Pixel index calculation (1-based for Dotti protocol)
         pixel_index = y * self.GRID_SIZE + x + 1
 
         # Command format: 0x07 0x02 <pixel_index> <r> <g> <b>
-        data = bytes([0x07, 0x02, pixel_index, r, g, b])
+        data = _PACK_SET_PIXEL(0x07, 0x02, pixel_index, r, g, b)
         await self._write(data)
-        
-        # Update internal buffer
-        self._pixel_buffer[y][x] = (r, g, b)
     
+    def get_pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        """
+        Return the buffered color of a single pixel.
+
+        Args:
+            x: X coordinate (0-7, left to right)
+            y: Y coordinate (0-7, top to bottom)
+
+        Returns:
+            RGB tuple from the internal buffer.
+        """
+        if not (0 <= x < self.GRID_SIZE and 0 <= y < self.GRID_SIZE):
+            raise ValueError(f"Coordinates must be 0-7, got x={x}, y={y}")
+
+        i = (y * self.GRID_SIZE + x) * 3
+        return tuple(self._pixel_buffer[i:i + 3])
+
     async def set_pixel_by_index(self, index: int, r: int, g: int, b: int):
         """
         Set a pixel by its linear index (0-63).
@@ -252,18 +477,17 @@ class Dotti:
             g: Green component (0-255)
             b: Blue component (0-255)
         """
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        
+        r, g, b = _clamp_rgb(r, g, b)
+
         # Command format: 0x06 0x01 <r> <g> <b>
-        data = bytes([0x06, 0x01, r, g, b])
+        data = self._ALL_PIXEL_CACHE.get((r, g, b))
+        if data is None:
+            data = _PACK_SET_ALL(0x06, 0x01, r, g, b)
+            self._ALL_PIXEL_CACHE[(r, g, b)] = data
         await self._write(data)
-        
-        # Update internal buffer
-        for y in range(self.GRID_SIZE):
-            for x in range(self.GRID_SIZE):
-                self._pixel_buffer[y][x] = (r, g, b)
+
+        # Update internal buffer (C-level fill, no Python loop)
+        self._pixel_buffer[:] = bytes((r, g, b)) * self.TOTAL_PIXELS
     
     async def turn_off(self):
         """Turn off all pixels (set to black)."""
@@ -281,11 +505,31 @@ class Dotti:
             brightness: Brightness level (0-100)
         """
         brightness = max(0, min(100, brightness))
-        
-        # Command format: 0x06 0x02 <brightness>
-        data = bytes([0x06, 0x02, brightness])
-        await self._write(data)
+
+        # Command format: 0x06 0x02 <brightness> (precomputed per level)
+        await self._write(self._BRIGHTNESS_CMDS[brightness])
+        self._last_brightness = brightness
     
+    async def set_pixels_bulk(self, updates: Iterable[Tuple[int, int, int, int, int]]):
+        """
+        Set multiple pixels with a single GATT write.
+
+        Preferred over repeated ``set_pixel`` calls whenever more than one
+        pixel changes: all updates are applied to the local buffer first,
+        then the whole frame goes out as one bulk write instead of N
+        per-pixel round-trips.
+
+        Args:
+            updates: Iterable of (x, y, r, g, b) tuples.
+        """
+        buf = self._pixel_buffer
+        for x, y, r, g, b in updates:
+            if not (0 <= x < self.GRID_SIZE and 0 <= y < self.GRID_SIZE):
+                raise ValueError(f"Coordinates must be 0-7, got x={x}, y={y}")
+            i = (y * self.GRID_SIZE + x) * 3
+            buf[i:i + 3] = _clamp_rgb(r, g, b)
+        await self._flush_buffer()
+
     async def set_row(self, row: int, colors: List[Tuple[int, int, int]]):
         """
         Set all pixels in a row.
@@ -298,9 +542,13 @@ class Dotti:
             raise ValueError(f"Row must be 0-7, got {row}")
         if len(colors) != self.GRID_SIZE:
             raise ValueError(f"Expected 8 colors, got {len(colors)}")
-        
-        for x, (r, g, b) in enumerate(colors):
-            await self.set_pixel(x, row, r, g, b)
+
+        # Rows are contiguous in the flat buffer: pack once, then one
+        # C-level slice assignment instead of eight index computations
+        self._pixel_buffer[self._ROW_SLICES[row]] = b"".join(
+            bytes(_clamp_rgb(r, g, b)) for r, g, b in colors
+        )
+        await self._flush_buffer()
     
     async def set_column(self, col: int, colors: List[Tuple[int, int, int]]):
         """
@@ -314,9 +562,11 @@ class Dotti:
             raise ValueError(f"Column must be 0-7, got {col}")
         if len(colors) != self.GRID_SIZE:
             raise ValueError(f"Expected 8 colors, got {len(colors)}")
-        
-        for y, (r, g, b) in enumerate(colors):
-            await self.set_pixel(col, y, r, g, b)
+
+        buf = self._pixel_buffer
+        for i, (r, g, b) in zip(self._COL_INDICES[col], colors):
+            buf[i:i + 3] = _clamp_rgb(r, g, b)
+        await self._flush_buffer()
     
     async def set_matrix(self, matrix: List[List[Tuple[int, int, int]]]):
         """
@@ -327,12 +577,16 @@ class Dotti:
         """
         if len(matrix) != self.GRID_SIZE:
             raise ValueError(f"Expected 8 rows, got {len(matrix)}")
-        
+
         for y, row in enumerate(matrix):
             if len(row) != self.GRID_SIZE:
                 raise ValueError(f"Expected 8 columns in row {y}, got {len(row)}")
-            for x, (r, g, b) in enumerate(row):
-                await self.set_pixel(x, y, r, g, b)
+
+        await self.set_pixels_bulk(
+            (x, y, r, g, b)
+            for y, row in enumerate(matrix)
+            for x, (r, g, b) in enumerate(row)
+        )
     
     async def save_to_slot(self, slot: int):
         """
@@ -348,7 +602,7 @@ class Dotti:
             raise ValueError(f"Slot must be 0-7, got {slot}")
         
         # Command format: 0x06 0x06 <slot>
-        data = bytes([0x06, 0x06, slot])
+        data = _PACK_SLOT(0x06, 0x06, slot)
         await self._write(data)
     
     async def load_from_slot(self, slot: int):
@@ -362,7 +616,7 @@ class Dotti:
             raise ValueError(f"Slot must be 0-7, got {slot}")
         
         # Command format: 0x06 0x05 <slot>
-        data = bytes([0x06, 0x05, slot])
+        data = _PACK_SLOT(0x06, 0x05, slot)
         await self._write(data)
     
     async def draw_character(self, char: str, color: Tuple[int, int, int], 
@@ -377,30 +631,32 @@ class Dotti:
             color: RGB color for the character
             bg_color: RGB background color
         """
-        from .fonts import FONT_5X7
-        
         char = char.upper()
-        if char not in FONT_5X7:
+        mask = FONT_5X7_PACKED.get(char)
+        if mask is None:
             raise ValueError(f"Unsupported character: {char}")
-        
-        bitmap = FONT_5X7[char]
-        
-        # Clear display first
-        await self.set_all_pixels(*bg_color)
-        
-        # Draw character (centered)
-        offset_x = 1
-        offset_y = 0
-        
-        for y, row in enumerate(bitmap):
-            for x, pixel in enumerate(row):
-                if pixel:
-                    await self.set_pixel(x + offset_x, y + offset_y, *color)
+
+        bg = bytes(_clamp_rgb(*bg_color))
+        fg = bytes(_clamp_rgb(*color))
+
+        # Compose the whole frame in the local buffer, then send it as a
+        # single bulk write instead of one clear plus up to 48 pixel
+        # writes. The blit itself runs in _blit (Numba-compiled when
+        # available, pure Python otherwise).
+        blit_glyph(self._pixel_buffer, mask << 1, fg, bg)  # offset_x = 1
+
+        await self._flush_buffer()
 
 
 class DottiAnimation:
-    """Helper class for creating animations on the Dotti display."""
-    
+    """
+    Helper class for creating animations on the Dotti display.
+
+    For higher frame rates, set ``dotti.reliable_writes = False`` before
+    animating: frames then go out without per-packet ACKs, at the cost of
+    an occasional silently dropped frame.
+    """
+
     def __init__(self, dotti: Dotti):
         self.dotti = dotti
     
@@ -423,10 +679,19 @@ class DottiAnimation:
             DottiColor.MAGENTA,
         ]
         
+        # Pace frames against absolute deadlines so GATT write latency is
+        # absorbed into the frame budget instead of added on top of it;
+        # loop.time is bound once to skip per-frame attribute lookups
+        now = asyncio.get_running_loop().time
+        deadline = now()
+
         for _ in range(cycles):
             for color in colors:
+                deadline += delay
                 await self.dotti.set_all_pixels(*color)
-                await asyncio.sleep(delay)
+                sleep_left = deadline - now()
+                if sleep_left > 0:
+                    await asyncio.sleep(sleep_left)
     
     async def blink(self, color: Tuple[int, int, int], times: int = 3, 
                     on_time: float = 0.5, off_time: float = 0.5):
@@ -439,11 +704,23 @@ class DottiAnimation:
             on_time: Duration of on state in seconds
             off_time: Duration of off state in seconds
         """
+        # Same deadline pacing as rainbow_cycle: write time counts against
+        # the on/off interval rather than stretching it
+        now = asyncio.get_running_loop().time
+        deadline = now()
+
         for _ in range(times):
+            deadline += on_time
             await self.dotti.set_all_pixels(*color)
-            await asyncio.sleep(on_time)
+            sleep_left = deadline - now()
+            if sleep_left > 0:
+                await asyncio.sleep(sleep_left)
+
+            deadline += off_time
             await self.dotti.turn_off()
-            await asyncio.sleep(off_time)
+            sleep_left = deadline - now()
+            if sleep_left > 0:
+                await asyncio.sleep(sleep_left)
     
     async def scroll_text(self, text: str, color: Tuple[int, int, int],
                          delay: float = 0.3):
@@ -474,67 +751,51 @@ class DottiAnimation:
             delay: Delay between sparkles in seconds
         """
         import random
-        
-        start_time = asyncio.get_event_loop().time()
-        
-        while asyncio.get_event_loop().time() - start_time < duration:
-            x = random.randint(0, 7)
-            y = random.randint(0, 7)
-            r = random.randint(0, 255)
-            g = random.randint(0, 255)
-            b = random.randint(0, 255)
-            
+
+        now = asyncio.get_running_loop().time
+        getrand = random.getrandbits
+        deadline = now() + duration
+
+        while now() < deadline:
+            # One 40-bit draw per frame instead of five randint calls:
+            # 3 bits x, 3 bits y, 8 bits per color channel
+            bits = getrand(40)
+            x = bits & 7
+            y = (bits >> 3) & 7
+            r = (bits >> 6) & 0xFF
+            g = (bits >> 14) & 0xFF
+            b = (bits >> 22) & 0xFF
+
             await self.dotti.set_pixel(x, y, r, g, b)
             await asyncio.sleep(delay)
 
 
-# Simple 5x7 font for basic characters
+# Simple 5x7 font for basic characters. One bytes literal per glyph, one
+# byte per row, bit (5 - col) per pixel: 8 bytes per glyph instead of 48
+# boxed Python ints, so the whole table fits in a cache line apiece
 FONT_5X7 = {
-    '0': [
-        [0, 1, 1, 1, 0, 0],
-        [1, 0, 0, 0, 1, 0],
-        [1, 0, 0, 1, 1, 0],
-        [1, 0, 1, 0, 1, 0],
-        [1, 1, 0, 0, 1, 0],
-        [1, 0, 0, 0, 1, 0],
-        [0, 1, 1, 1, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-    ],
-    '1': [
-        [0, 0, 1, 0, 0, 0],
-        [0, 1, 1, 0, 0, 0],
-        [0, 0, 1, 0, 0, 0],
-        [0, 0, 1, 0, 0, 0],
-        [0, 0, 1, 0, 0, 0],
-        [0, 0, 1, 0, 0, 0],
-        [0, 1, 1, 1, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-    ],
-    'A': [
-        [0, 0, 1, 0, 0, 0],
-        [0, 1, 0, 1, 0, 0],
-        [1, 0, 0, 0, 1, 0],
-        [1, 1, 1, 1, 1, 0],
-        [1, 0, 0, 0, 1, 0],
-        [1, 0, 0, 0, 1, 0],
-        [1, 0, 0, 0, 1, 0],
-        [0, 0, 0, 0, 0, 0],
-    ],
-    ' ': [
-        [0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-        [0, 0, 0, 0, 0, 0],
-    ],
+    '0': b'\x1c\x22\x26\x2a\x32\x22\x1c\x00',
+    '1': b'\x08\x18\x08\x08\x08\x08\x1c\x00',
+    'A': b'\x08\x14\x22\x3e\x22\x22\x22\x00',
+    ' ': b'\x00\x00\x00\x00\x00\x00\x00\x00',
+}
+
+# Each glyph additionally packed into a single uint64 at import time: bit
+# (row*8 + col) is set for every lit pixel, so rendering is a
+# register-sized bit walk instead of per-pixel table lookups
+FONT_5X7_PACKED = {
+    char: sum(
+        ((row_byte >> (5 - col)) & 1) << (row * 8 + col)
+        for row, row_byte in enumerate(bitmap)
+        for col in range(6)
+    )
+    for char, bitmap in FONT_5X7.items()
 }
 
 
 async def main():
     """Example usage of the Dotti library."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     dotti = Dotti()
     
     try:
@@ -2,11 +2,17 @@
 Dotti Pixel Editor - FastAPI Backend
 """
 import asyncio
+import hashlib
+import json
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from contextlib import asynccontextmanager
 from typing import Optional
 
+import numpy as np
+
 # Preset emoji patterns (8x8)
 _ = [0, 0, 0]
 R = [255, 0, 0]
@@ -125,11 +131,21 @@ PRESETS = {
     },
 }
 
+# Flatten each preset to a 192-byte blob once at import: loading a preset
+# then costs one memcpy plus a fresh-matrix expansion, instead of row
+# copies that leave the inner [r,g,b] lists aliased across presets
+for _preset in PRESETS.values():
+    _preset["bytes"] = bytes(c for row in _preset["pixels"] for px in row for c in px)
+del _preset
+
 from fastapi import FastAPI, Request, Form, Depends, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from jinja2 import FileSystemBytecodeCache
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Add parent directory to path for dotti import
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -137,16 +153,33 @@ from dotti import Dotti
 
 from editor.database import init_db, get_db, Image
 
-# Global state
+# Global state. The pixel grid is a contiguous uint8 array: clears and
+# preset loads are single C-level fills/copies instead of rebuilding 73
+# Python lists, and the buffer is already wire-shaped for a BLE frame.
 dotti: Optional[Dotti] = None
-current_pixels: list = [[[0, 0, 0] for _ in range(8)] for _ in range(8)]
+current_pixels = np.zeros((8, 8, 3), dtype=np.uint8)
+
+# Serializes grid mutation + BLE transmit. Awaiting the Dotti mid-update
+# yields control, so without it a concurrent request could observe (and
+# push) a half-applied grid.
+state_lock = asyncio.Lock()
+
+# Palette for /random, matching the editor's color picker defaults
+_RANDOM_PALETTE = np.array([
+    [255, 0, 0], [0, 255, 0], [0, 0, 255],
+    [255, 255, 0], [255, 0, 255], [0, 255, 255],
+    [255, 128, 0], [255, 255, 255], [0, 0, 0],
+], dtype=np.uint8)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     global dotti
-    init_db()
+    await init_db()
+
+    # Gallery cache buster: repopulated lazily on the first read
+    app.state.images_cache = None
 
     # Try to connect to Dotti
     dotti = Dotti()
@@ -172,40 +205,141 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(title="Dotti Pixel Editor", lifespan=lifespan)
 app.mount("/static", StaticFiles(directory=Path(__file__).parent / "static"), name="static")
-templates = Jinja2Templates(directory=Path(__file__).parent / "templates")
-
-
+# Templates never change at runtime: auto_reload=False skips the
+# per-render os.stat freshness check, and the bytecode cache (in the
+# system temp dir) persists compiled templates across restarts
+templates = Jinja2Templates(
+    directory=Path(__file__).parent / "templates",
+    auto_reload=False,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+
+# Both converters are pure functions of their input, so a per-process
+# cache is safe; users paint long stretches in one color, making repeat
+# conversions the common case
+@lru_cache(maxsize=512)
 def hex_to_rgb(hex_color: str) -> tuple:
     """Convert hex color to RGB tuple."""
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
+# Lazily filled (r, g, b) -> "#rrggbb" table. The editor only ever
+# touches a handful of palette colors, and a plain dict skips the lock
+# and wrapper call lru_cache would add on this per-pixel path
+_HEX_TABLE: dict = {}
+
+
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """Convert RGB to hex color."""
-    return f"#{r:02x}{g:02x}{b:02x}"
+    key = (r, g, b)
+    h = _HEX_TABLE.get(key)
+    if h is None:
+        h = _HEX_TABLE[key] = f"#{r:02x}{g:02x}{b:02x}"
+    return h
+
+
+# Filter form for the templates, replacing inline %-format conversions
+templates.env.filters["rgb_hex"] = lambda px: rgb_to_hex(px[0], px[1], px[2])
+
+
+# Same markup as partials/grid.html, emitted without the template engine
+_PIXEL_DIV = (
+    '<div class="pixel"'
+    ' style="background-color: {hex};"'
+    ' data-x="{x}" data-y="{y}"'
+    ' hx-post="/pixel/{x}/{y}"'
+    ' hx-vals="js:{{color: document.getElementById(\'colorPicker\').value}}"'
+    ' hx-swap="outerHTML"></div>'
+)
+
+
+def _grid_response() -> Response:
+    """
+    Empty response whose HX-Trigger carries the raw grid state.
+
+    The gridUpdated event hands the client the 192-byte state as hex and
+    a page-level listener recolors the existing pixel divs in place, so
+    no grid HTML travels on these responses at all - 384 header bytes
+    instead of 64 rendered divs.
+    """
+    return Response(
+        status_code=204,
+        headers={"HX-Trigger": json.dumps(
+            {"gridUpdated": current_pixels.tobytes().hex()}
+        )},
+    )
+
+
+async def _get_images(db: AsyncSession) -> list:
+    """
+    Return the gallery rows, newest first.
+
+    The full ordered query only runs when the cache is cold; mutations
+    update or invalidate the cached list instead of re-scanning the table
+    on every request.
+    """
+    images = app.state.images_cache
+    if images is None:
+        result = await db.execute(
+            select(Image).order_by(Image.created_at.desc())
+        )
+        images = list(result.scalars())
+        app.state.images_cache = images
+    return images
 
 
 @app.get("/", response_class=HTMLResponse)
-async def editor(request: Request, db: Session = Depends(get_db)):
+async def editor(request: Request, db: AsyncSession = Depends(get_db)):
     """Render the editor page."""
-    images = db.query(Image).order_by(Image.created_at.desc()).all()
-    return templates.TemplateResponse("editor.html", {
+    images = await _get_images(db)
+
+    # Validator over everything the page renders: newest gallery
+    # timestamp, row count and the grid state. The count matters because
+    # deleting anything but the newest image leaves the timestamp alone.
+    # An unchanged page costs a hash comparison and an empty 304 instead
+    # of a DB read plus full render.
+    newest = images[0].created_at if images else None
+    etag = hashlib.md5(
+        f"{newest}:{len(images)}".encode() + current_pixels.tobytes()
+    ).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    response = templates.TemplateResponse("editor.html", {
         "request": request,
-        "pixels": current_pixels,
+        "pixels": current_pixels.tolist(),
         "images": images,
         "presets": PRESETS,
         "dotti_connected": dotti is not None and dotti.is_connected,
     })
+    response.headers["ETag"] = etag
+    return response
+
+
+# Connection-state memo: is_connected walks into the bleak client on
+# every call, which adds up at one check per paint. A positive result is
+# trusted for half a second; a dropped link just means one extra failed
+# write before the slow path runs again.
+_CONN_CHECK_TTL = 0.5
+_last_conn_check = 0.0
+_conn_ok = False
 
 
 async def ensure_dotti_connected():
     """Ensure Dotti is connected, reconnect if needed."""
-    global dotti
+    global dotti, _last_conn_check, _conn_ok
+
+    now = time.monotonic()
+    if _conn_ok and now - _last_conn_check < _CONN_CHECK_TTL:
+        return True
+
     if dotti is None:
         dotti = Dotti()
 
     if not dotti.is_connected:
+        _conn_ok = False
         print("Dotti reconnecting...")
         try:
             await dotti.connect(timeout=10)
@@ -213,9 +347,57 @@ async def ensure_dotti_connected():
         except Exception as e:
             print(f"Dotti reconnect failed: {e}")
             return False
+
+    _conn_ok = True
+    _last_conn_check = now
     return True
 
 
+# Grid state as last mirrored to the device, for diff-based pushes.
+# Reset whenever a push fails so the next one sends everything again.
+_last_pushed: Optional[np.ndarray] = None
+
+# Below this many changed pixels, per-pixel commands cost less airtime
+# than re-sending the whole 194-byte frame
+_DIFF_THRESHOLD = 16
+
+
+async def _push_full_frame():
+    """Mirror the whole grid to the Dotti, if one is reachable."""
+    global _last_pushed
+    if not await ensure_dotti_connected():
+        return
+    try:
+        # Diff against the device's known state: vectorized compare per
+        # cell, then transmit only what actually changed
+        if _last_pushed is not None:
+            changed = np.argwhere((current_pixels != _last_pushed).any(axis=2))
+            if len(changed) == 0:
+                return
+            if len(changed) <= _DIFF_THRESHOLD:
+                await asyncio.gather(*(
+                    dotti.set_pixel(int(x), int(y), *map(int, current_pixels[y, x]))
+                    for y, x in changed
+                ))
+                _last_pushed = current_pixels.copy()
+                return
+
+        if hasattr(dotti, "set_matrix"):
+            # One bulk frame instead of 64 sequential per-pixel writes
+            await dotti.set_matrix(current_pixels)
+        else:
+            # Per-pixel fallback: queue all 64 writes concurrently so they
+            # pipeline through the BLE stack rather than awaiting each ACK
+            await asyncio.gather(*(
+                dotti.set_pixel(x, y, *current_pixels[y, x])
+                for y in range(8) for x in range(8)
+            ))
+        _last_pushed = current_pixels.copy()
+    except Exception as e:
+        _last_pushed = None
+        print(f"Dotti error: {e}")
+
+
 @app.post("/pixel/{x}/{y}", response_class=HTMLResponse)
 async def set_pixel(x: int, y: int, color: str = Form(...), request: Request = None):
     """Set a single pixel and return updated grid."""
@@ -223,75 +405,75 @@ async def set_pixel(x: int, y: int, color: str = Form(...), request: Request = N
         raise HTTPException(status_code=400, detail="Invalid coordinates")
 
     r, g, b = hex_to_rgb(color)
-    current_pixels[y][x] = [r, g, b]
-
-    # Send to Dotti if connected
-    if await ensure_dotti_connected():
-        try:
-            await dotti.set_pixel(x, y, r, g, b)
-        except Exception as e:
-            print(f"Dotti error: {e}")
+    async with state_lock:
+        current_pixels[y, x] = (r, g, b)
+
+        # Send to Dotti if connected
+        if await ensure_dotti_connected():
+            try:
+                await dotti.set_pixel(x, y, r, g, b)
+                if _last_pushed is not None:
+                    _last_pushed[y, x] = (r, g, b)
+            except Exception as e:
+                print(f"Dotti error: {e}")
 
     # Return just the updated pixel div
-    hex_color = rgb_to_hex(r, g, b)
-    return f'''<div class="pixel"
-        style="background-color: {hex_color};"
-        data-x="{x}" data-y="{y}"
-        hx-post="/pixel/{x}/{y}"
-        hx-vals="js:{{color: document.getElementById('colorPicker').value}}"
-        hx-swap="outerHTML"></div>'''
+    return _PIXEL_DIV.format(hex=rgb_to_hex(r, g, b), x=x, y=y)
+
+
+class PixelUpdate(BaseModel):
+    x: int
+    y: int
+    color: str
+
+
+class PixelBatch(BaseModel):
+    updates: list[PixelUpdate]
+
+
+@app.post("/pixels/batch", response_class=HTMLResponse)
+async def set_pixels_batch(batch: PixelBatch):
+    """Apply a debounced batch of paints as one grid update and BLE push."""
+    for u in batch.updates:
+        if not (0 <= u.x < 8 and 0 <= u.y < 8):
+            raise HTTPException(status_code=400, detail="Invalid coordinates")
+
+    async with state_lock:
+        for u in batch.updates:
+            current_pixels[u.y, u.x] = hex_to_rgb(u.color)
+        await _push_full_frame()
+
+    return _grid_response()
 
 
 @app.post("/clear", response_class=HTMLResponse)
 async def clear_grid(request: Request):
     """Clear all pixels."""
-    global current_pixels
-    current_pixels = [[[0, 0, 0] for _ in range(8)] for _ in range(8)]
+    async with state_lock:
+        current_pixels.fill(0)
 
-    if await ensure_dotti_connected():
-        try:
-            await dotti.turn_off()
-        except Exception as e:
-            print(f"Dotti error: {e}")
+        if await ensure_dotti_connected():
+            try:
+                await dotti.turn_off()
+            except Exception as e:
+                print(f"Dotti error: {e}")
 
-    return templates.TemplateResponse("partials/grid.html", {
-        "request": request,
-        "pixels": current_pixels,
-    })
+    return _grid_response()
 
 
 @app.post("/random", response_class=HTMLResponse)
 async def random_grid(request: Request):
     """Fill grid with random colors."""
-    import random
-    global current_pixels
-
-    # Predefined vibrant colors for better results
-    colors = [
-        [255, 0, 0], [0, 255, 0], [0, 0, 255],
-        [255, 255, 0], [255, 0, 255], [0, 255, 255],
-        [255, 128, 0], [255, 255, 255], [0, 0, 0],
-    ]
-
-    for y in range(8):
-        for x in range(8):
-            color = random.choice(colors)
-            current_pixels[y][x] = color
-
-    # Send to Dotti
-    if await ensure_dotti_connected():
-        try:
-            for y in range(8):
-                for x in range(8):
-                    r, g, b = current_pixels[y][x]
-                    await dotti.set_pixel(x, y, r, g, b)
-        except Exception as e:
-            print(f"Dotti error: {e}")
+    async with state_lock:
+        # One vectorized draw: pick 64 palette indices, then fancy-index
+        # the palette straight into the grid
+        idx = np.random.randint(0, len(_RANDOM_PALETTE), size=(8, 8))
+        current_pixels[:] = _RANDOM_PALETTE[idx]
 
-    return templates.TemplateResponse("partials/grid.html", {
-        "request": request,
-        "pixels": current_pixels,
-    })
+        # Send to Dotti
+        await _push_full_frame()
+
+    return _grid_response()
 
 
 @app.post("/slot/save/{slot_id}", response_class=HTMLResponse)
@@ -327,49 +509,40 @@ async def load_from_slot(slot_id: int, request: Request):
 @app.post("/preset/{preset_id}", response_class=HTMLResponse)
 async def load_preset(preset_id: str, request: Request):
     """Load a preset pattern."""
-    global current_pixels
-
     if preset_id not in PRESETS:
         raise HTTPException(status_code=404, detail="Preset not found")
 
-    current_pixels = [row[:] for row in PRESETS[preset_id]["pixels"]]
+    async with state_lock:
+        current_pixels[:] = np.frombuffer(
+            PRESETS[preset_id]["bytes"], dtype=np.uint8
+        ).reshape(8, 8, 3)
 
-    # Send to Dotti
-    if await ensure_dotti_connected():
-        try:
-            for y in range(8):
-                for x in range(8):
-                    r, g, b = current_pixels[y][x]
-                    await dotti.set_pixel(x, y, r, g, b)
-        except Exception as e:
-            print(f"Dotti error: {e}")
+        # Send to Dotti
+        await _push_full_frame()
 
-    return templates.TemplateResponse("partials/grid.html", {
-        "request": request,
-        "pixels": current_pixels,
-    })
+    return _grid_response()
 
 
 @app.post("/save", response_class=HTMLResponse)
-async def save_image(request: Request, name: str = Form(...), db: Session = Depends(get_db)):
+async def save_image(request: Request, name: str = Form(...), db: AsyncSession = Depends(get_db)):
     """Save current image to database."""
     if not name.strip():
         name = "Unnamed"
 
-    # Flatten pixels to list
-    flat_pixels = []
-    for row in current_pixels:
-        for pixel in row:
-            flat_pixels.append(pixel)
-
-    image = Image(name=name.strip())
-    image.set_pixels(flat_pixels)
+    # The array is C-contiguous uint8, so its raw bytes are exactly the
+    # row-major RGB blob the column stores - no reshape/tolist round trip
+    image = Image(name=name.strip(), pixels=current_pixels.tobytes())
     db.add(image)
-    db.commit()
-    db.refresh(image)
+    await db.commit()
+    await db.refresh(image)
+
+    # Newest-first order means the fresh row simply goes on the front;
+    # a cold cache is filled by the shared read path instead
+    if app.state.images_cache is not None:
+        app.state.images_cache = [image] + app.state.images_cache
 
     # Return updated image list
-    images = db.query(Image).order_by(Image.created_at.desc()).all()
+    images = await _get_images(db)
     return templates.TemplateResponse("partials/image_list.html", {
         "request": request,
         "images": images,
@@ -377,41 +550,35 @@ async def save_image(request: Request, name: str = Form(...), db: Session = Depe
 
 
 @app.post("/load/{image_id}", response_class=HTMLResponse)
-async def load_image(image_id: int, request: Request, db: Session = Depends(get_db)):
+async def load_image(image_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     """Load image from database and display on Dotti."""
-    global current_pixels
-
-    image = db.query(Image).filter(Image.id == image_id).first()
+    image = await db.get(Image, image_id)
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
 
-    current_pixels = image.get_matrix()
+    async with state_lock:
+        # The stored blob has the array's exact memory layout
+        current_pixels[:] = np.frombuffer(image.pixels, dtype=np.uint8).reshape(8, 8, 3)
 
-    # Send to Dotti
-    if await ensure_dotti_connected():
-        try:
-            for y in range(8):
-                for x in range(8):
-                    r, g, b = current_pixels[y][x]
-                    await dotti.set_pixel(x, y, r, g, b)
-        except Exception as e:
-            print(f"Dotti error: {e}")
+        # Send to Dotti
+        await _push_full_frame()
 
-    return templates.TemplateResponse("partials/grid.html", {
-        "request": request,
-        "pixels": current_pixels,
-    })
+    return _grid_response()
 
 
 @app.delete("/images/{image_id}", response_class=HTMLResponse)
-async def delete_image(image_id: int, request: Request, db: Session = Depends(get_db)):
+async def delete_image(image_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     """Delete image from database."""
-    image = db.query(Image).filter(Image.id == image_id).first()
+    image = await db.get(Image, image_id)
     if image:
-        db.delete(image)
-        db.commit()
-
-    images = db.query(Image).order_by(Image.created_at.desc()).all()
+        await db.delete(image)
+        await db.commit()
+        if app.state.images_cache is not None:
+            app.state.images_cache = [
+                img for img in app.state.images_cache if img.id != image_id
+            ]
+
+    images = await _get_images(db)
     return templates.TemplateResponse("partials/image_list.html", {
         "request": request,
         "images": images,
@@ -3,47 +3,118 @@ SQLite Database for Dotti Pixel Editor
 """
 import json
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import event, text, Column, Integer, String, DateTime, LargeBinary
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
 
-DATABASE_URL = "sqlite:///./dotti_images.db"
+DATABASE_URL = "sqlite+aiosqlite:///./dotti_images.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Single-process desktop app on one SQLite file: a StaticPool keeps one
+# connection open for the lifetime of the process instead of checking
+# one in and out per request. The aiosqlite driver runs queries off the
+# event loop, so commits no longer stall concurrent BLE writes.
+engine = create_async_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, _record):
+    """
+    Tune each new SQLite connection for the editor's workload.
+
+    WAL lets gallery reads proceed while a save is committing instead of
+    serializing on the rollback journal; synchronous=NORMAL drops the
+    per-commit fsync while staying crash-safe in WAL mode. Temp tables in
+    memory and a 64 MB mmap window round out the read path.
+    """
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=67108864")
+    cur.close()
+
+
+# expire_on_commit=False keeps loaded rows readable after their session
+# closes, which the app-level gallery cache relies on
+SessionLocal = async_sessionmaker(engine, autoflush=False,
+                                  expire_on_commit=False)
 Base = declarative_base()
 
 
+def bytes_to_matrix(blob: bytes) -> list:
+    """
+    Expand 192 row-major RGB bytes into a fresh 8x8 matrix of [r,g,b] lists.
+
+    Every inner list is newly allocated, so callers can mutate the result
+    without aliasing the source blob or other matrices.
+    """
+    return [
+        [list(blob[row * 24 + x * 3:row * 24 + x * 3 + 3]) for x in range(8)]
+        for row in range(8)
+    ]
+
+
 class Image(Base):
     __tablename__ = "images"
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
-    pixels = Column(Text, nullable=False)  # JSON: [[r,g,b], ...] 64 entries
-    created_at = Column(DateTime, default=datetime.utcnow)
+    pixels = Column(LargeBinary, nullable=False)  # 192 raw RGB bytes, row-major
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     def get_pixels(self) -> list:
-        """Return pixels as list of [r,g,b] tuples."""
-        return json.loads(self.pixels)
+        """Return pixels as list of [r,g,b] lists."""
+        b = self.pixels
+        return [list(b[i:i + 3]) for i in range(0, len(b), 3)]
 
     def set_pixels(self, pixels: list):
         """Set pixels from list of [r,g,b] tuples."""
-        self.pixels = json.dumps(pixels)
+        self.pixels = bytes(c for px in pixels for c in px)
 
     def get_matrix(self) -> list:
         """Return pixels as 8x8 matrix."""
-        flat = self.get_pixels()
-        return [flat[i*8:(i+1)*8] for i in range(8)]
+        return bytes_to_matrix(self.pixels)
+
+
+async def _migrate_legacy_json_rows(conn):
+    """One-shot conversion of rows that still store pixels as JSON text."""
+    rows = await conn.execute(text("SELECT id, pixels FROM images"))
+    for row_id, pixels in rows:
+        if isinstance(pixels, bytes):
+            # Discriminate by shape, not content: a migrated row is exactly
+            # the 192 raw RGB bytes, while the JSON text is always longer
+            # (and could itself start with 0x5B == "[" as a red component)
+            if len(pixels) == 192:
+                continue
+            pixels = pixels.decode()
+        try:
+            blob = bytes(c for px in json.loads(pixels) for c in px)
+        except (ValueError, TypeError):
+            continue  # not legacy JSON; leave the row untouched
+        await conn.execute(
+            text("UPDATE images SET pixels = :blob WHERE id = :id"),
+            {"blob": blob, "id": row_id},
+        )
 
 
-def init_db():
+async def init_db():
     """Create database tables."""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all only builds indexes for tables it creates; cover
+        # databases that predate the created_at index too
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_images_created_at ON images (created_at)"
+        ))
+        await _migrate_legacy_json_rows(conn)
 
 
-def get_db():
-    """Get database session."""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """Get a database session backed by the shared connection."""
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()